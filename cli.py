@@ -3,18 +3,17 @@
 Binance Futures Trading Bot CLI
 
 A modern command-line interface for placing orders on Binance Futures Testnet.
+
+Heavy imports (rich tables/panels, the Binance SDK, validation models) are
+deferred into the commands that use them to keep startup fast.
 """
 
 import typer
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich import print as rprint
+from enum import Enum
 from typing import Optional
 import sys
 import os
-from pathlib import Path
-import click
 
 # Fix for typer/click compatibility issue
 # Typer < 0.12.3 calls make_metavar without ctx, but Click 8.x requires it
@@ -45,10 +44,6 @@ except Exception:
     pass
 
 from dotenv import load_dotenv
-from trading_bot.client import BinanceFuturesClient
-from trading_bot.orders import OrderManager
-from trading_bot.validators import OrderRequest
-from trading_bot.logging_config import logger
 
 # Load environment variables
 load_dotenv()
@@ -61,8 +56,13 @@ app = typer.Typer(
 )
 console = Console()
 
+class OutputFormat(str, Enum):
+    """Output formats for listing commands"""
+    table = "table"
+    json = "json"
+
 def get_client():
-    """Initialize and return Binance client"""
+    """Initialize and return the shared Binance client"""
     api_key = os.environ.get('BINANCE_API_KEY')
     api_secret = os.environ.get('BINANCE_API_SECRET')
     use_testnet = os.environ.get('USE_TESTNET', 'true').lower() == 'true'
@@ -73,7 +73,8 @@ def get_client():
         raise typer.Exit(1)
     
     try:
-        return BinanceFuturesClient(api_key, api_secret, testnet=use_testnet)
+        from trading_bot.client import get_client as get_shared_client
+        return get_shared_client(api_key, api_secret, testnet=use_testnet)
     except Exception as e:
         console.print(f"[red]Error initializing Binance client:[/red] {str(e)}")
         console.print("[yellow]Note: This may be due to geo-restrictions from Binance[/yellow]")
@@ -91,6 +92,11 @@ def place_market_order(
     Example:
         trading-bot market BTCUSDT BUY 0.002
     """
+    from rich.panel import Panel
+    from rich.table import Table
+    from trading_bot.orders import OrderManager
+    from trading_bot.validators import parse_order_request
+    
     try:
         console.print(Panel.fit(
             f"[bold cyan]Placing MARKET Order[/bold cyan]\n"
@@ -103,12 +109,12 @@ def place_market_order(
         client = get_client()
         order_manager = OrderManager(client)
         
-        order_request = OrderRequest(
-            symbol=symbol.upper(),
-            side=side.upper(),
-            orderType="MARKET",
-            quantity=quantity
-        )
+        order_request = parse_order_request({
+            "symbol": symbol.upper(),
+            "side": side.upper(),
+            "orderType": "MARKET",
+            "quantity": quantity
+        })
         
         result = order_manager.place_order(order_request)
         
@@ -150,6 +156,11 @@ def place_limit_order(
     Example:
         trading-bot limit BTCUSDT BUY 0.002 50000
     """
+    from rich.panel import Panel
+    from rich.table import Table
+    from trading_bot.orders import OrderManager
+    from trading_bot.validators import parse_order_request
+    
     try:
         console.print(Panel.fit(
             f"[bold cyan]Placing LIMIT Order[/bold cyan]\n"
@@ -163,13 +174,13 @@ def place_limit_order(
         client = get_client()
         order_manager = OrderManager(client)
         
-        order_request = OrderRequest(
-            symbol=symbol.upper(),
-            side=side.upper(),
-            orderType="LIMIT",
-            quantity=quantity,
-            price=price
-        )
+        order_request = parse_order_request({
+            "symbol": symbol.upper(),
+            "side": side.upper(),
+            "orderType": "LIMIT",
+            "quantity": quantity,
+            "price": price
+        })
         
         result = order_manager.place_order(order_request)
         
@@ -200,7 +211,9 @@ def place_limit_order(
 
 
 @app.command("balance")
-def check_balance():
+def check_balance(
+    output: OutputFormat = typer.Option(OutputFormat.table, "--output", "-o", help="Output format: table or json", show_default="table"),
+):
     """
     Check account balance
     """
@@ -208,10 +221,16 @@ def check_balance():
         client = get_client()
         balances = client.get_balance()
         
+        if output == OutputFormat.json:
+            import orjson
+            sys.stdout.buffer.write(orjson.dumps(balances, option=orjson.OPT_APPEND_NEWLINE))
+            return
+        
         if not balances:
             console.print("[yellow]No assets with non-zero balance found[/yellow]")
             return
         
+        from rich.table import Table
         table = Table(title="Account Balance", show_header=True, header_style="bold magenta")
         table.add_column("Asset", style="cyan")
         table.add_column("Wallet Balance", style="green", justify="right")
@@ -237,6 +256,8 @@ def get_price(
     """
     Get current price for a symbol
     """
+    from rich.panel import Panel
+    
     try:
         client = get_client()
         ticker = client.get_ticker_price(symbol.upper())
@@ -253,7 +274,8 @@ def get_price(
 
 @app.command("orders")
 def list_open_orders(
-    symbol: Optional[str] = typer.Argument(None, help="Trading pair symbol (optional)")
+    symbol: Optional[str] = typer.Argument(None, help="Trading pair symbol (optional)"),
+    output: OutputFormat = typer.Option(OutputFormat.table, "--output", "-o", help="Output format: table or json", show_default="table"),
 ):
     """
     List open orders
@@ -262,10 +284,16 @@ def list_open_orders(
         client = get_client()
         orders = client.get_open_orders(symbol.upper() if symbol else None)
         
+        if output == OutputFormat.json:
+            import orjson
+            sys.stdout.buffer.write(orjson.dumps(orders, option=orjson.OPT_APPEND_NEWLINE))
+            return
+        
         if not orders:
             console.print("[yellow]No open orders found[/yellow]")
             return
         
+        from rich.table import Table
         table = Table(title="Open Orders", show_header=True, header_style="bold magenta")
         table.add_column("Order ID", style="cyan")
         table.add_column("Symbol", style="yellow")
@@ -1,9 +1,83 @@
 from binance.client import Client
 from binance.exceptions import BinanceAPIException, BinanceRequestException
-from typing import Dict, Any, Optional
+from requests.exceptions import ConnectionError as RequestsConnectionError, Timeout
+from tenacity import retry, retry_if_exception, stop_any, stop_after_attempt, wait_exponential_jitter
+from typing import Dict, Any, Optional, Tuple
+import functools
 import os
+import threading
+import time
 from .logging_config import logger
 
+# Exchange info (symbols, filters) changes rarely; refetch at most this often
+EXCHANGE_INFO_TTL = 600  # seconds
+
+# Ticker prices are reused briefly to absorb rapid repeated polling
+TICKER_PRICE_TTL = 0.5  # seconds
+TICKER_CACHE_SIZE = 512
+
+# HTTP statuses worth retrying: rate limiting (429) and server-side failures.
+# 418 is deliberately excluded - it means the IP is already banned for
+# ignoring 429s, and retrying would only extend the ban.
+TRANSIENT_STATUS_CODES = (429, 500, 502, 503, 504)
+RATE_LIMIT_ERROR_CODE = -1003  # Binance "too many requests"
+
+def _is_transient(exc: BaseException) -> bool:
+    """Return True for errors that are likely to succeed on retry"""
+    if isinstance(exc, BinanceAPIException):
+        return exc.status_code in TRANSIENT_STATUS_CODES or exc.code == RATE_LIMIT_ERROR_CODE
+    return isinstance(exc, (BinanceRequestException, RequestsConnectionError, Timeout))
+
+# Longest we'll sleep between attempts; a longer Retry-After ends retrying
+RETRY_MAX_WAIT = 2.0  # seconds
+
+_backoff = wait_exponential_jitter(initial=0.1, max=RETRY_MAX_WAIT)
+
+def _retry_after(retry_state) -> Optional[float]:
+    """Return the Retry-After delay (seconds) sent with the last error, if any"""
+    response = getattr(retry_state.outcome.exception(), 'response', None)
+    retry_after = response.headers.get('Retry-After') if response is not None else None
+    if retry_after and retry_after.isdigit():
+        return float(retry_after)
+    return None
+
+def _retry_after_too_long(retry_state) -> bool:
+    """Give up instead of blocking when Binance asks us to wait past RETRY_MAX_WAIT"""
+    retry_after = _retry_after(retry_state)
+    return retry_after is not None and retry_after > RETRY_MAX_WAIT
+
+def _retry_wait(retry_state) -> float:
+    """Honour Binance's Retry-After header, otherwise back off with jitter"""
+    retry_after = _retry_after(retry_state)
+    if retry_after is not None:
+        return retry_after
+    return _backoff(retry_state)
+
+def _log_retry(retry_state) -> None:
+    """Log a failed attempt that is about to be retried (not yet a user-facing error)"""
+    call = retry_state.args[0]
+    logger.warning(
+        "Transient error from %s (attempt %d), retrying in %.2fs: %s",
+        getattr(call, '__name__', call), retry_state.attempt_number,
+        retry_state.next_action.sleep, retry_state.outcome.exception()
+    )
+
+@retry(
+    retry=retry_if_exception(_is_transient),
+    wait=_retry_wait,
+    stop=stop_any(stop_after_attempt(4), _retry_after_too_long),
+    before_sleep=_log_retry,
+    reraise=True,
+)
+def call_with_retry(call, *args, **kwargs):
+    """
+    Run an idempotent SDK read, retrying transient errors with backoff
+    
+    Retried attempts are logged as warnings; only the final exception is
+    raised, so callers log a failure once. Order placement is never retried.
+    """
+    return call(*args, **kwargs)
+
 class BinanceFuturesClient:
     """Wrapper for Binance Futures API client with error handling"""
     
@@ -20,93 +94,138 @@ class BinanceFuturesClient:
         self.api_secret = api_secret
         self.testnet = testnet
         
+        # Cached exchange info: full payload plus a symbol -> info index
+        self._exchange_info: Optional[Dict[str, Any]] = None
+        self._exchange_by_symbol: Dict[str, Dict[str, Any]] = {}
+        self._exchange_fetched_at = 0.0
+        self._exchange_lock = threading.Lock()
+        
+        # Cached ticker prices: symbol -> (fetched_at, ticker)
+        self._ticker_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._ticker_lock = threading.Lock()
+        
         try:
             self.client = Client(api_key, api_secret, testnet=testnet)
             if testnet:
                 self.client.API_URL = 'https://testnet.binancefuture.com'
             
-            logger.info(f"Initialized Binance Futures client (testnet={testnet})")
+            logger.info("Initialized Binance Futures client (testnet=%s)", testnet)
         except Exception as e:
-            logger.error(f"Failed to initialize Binance client: {str(e)}")
+            logger.error("Failed to initialize Binance client: %s", e)
             raise
     
     def get_account_info(self) -> Dict[str, Any]:
         """Get futures account information"""
         try:
             logger.info("Fetching account information")
-            account = self.client.futures_account()
+            account = call_with_retry(self.client.futures_account)
             logger.info("Successfully fetched account information")
             return account
         except BinanceAPIException as e:
-            logger.error(f"Binance API error: {e.status_code} - {e.message}")
+            logger.error("Binance API error: %s - %s", e.status_code, e.message)
             raise
         except BinanceRequestException as e:
-            logger.error(f"Binance request error: {str(e)}")
+            logger.error("Binance request error: %s", e)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error fetching account info: {str(e)}")
+            logger.error("Unexpected error fetching account info: %s", e)
             raise
     
     def get_exchange_info(self, symbol: Optional[str] = None) -> Dict[str, Any]:
-        """Get exchange information for futures"""
+        """Get exchange information for futures (cached for EXCHANGE_INFO_TTL seconds)"""
         try:
-            logger.info(f"Fetching exchange info for {symbol or 'all symbols'}")
-            info = self.client.futures_exchange_info()
+            with self._exchange_lock:
+                if (self._exchange_info is None
+                        or time.monotonic() - self._exchange_fetched_at >= EXCHANGE_INFO_TTL):
+                    logger.info("Fetching exchange info for %s", symbol or "all symbols")
+                    info = self.client.futures_exchange_info()
+                    self._exchange_info = info
+                    self._exchange_by_symbol = {s['symbol']: s for s in info['symbols']}
+                    self._exchange_fetched_at = time.monotonic()
+                else:
+                    logger.debug("Using cached exchange info for %s", symbol or "all symbols")
+                info = self._exchange_info
+                by_symbol = self._exchange_by_symbol
             
             if symbol:
-                symbols_info = [s for s in info['symbols'] if s['symbol'] == symbol]
-                if not symbols_info:
+                symbol_info = by_symbol.get(symbol)
+                if symbol_info is None:
                     raise ValueError(f"Symbol {symbol} not found")
-                return symbols_info[0]
+                return symbol_info
             
             return info
         except BinanceAPIException as e:
-            logger.error(f"Binance API error: {e.status_code} - {e.message}")
+            logger.error("Binance API error: %s - %s", e.status_code, e.message)
             raise
         except Exception as e:
-            logger.error(f"Error fetching exchange info: {str(e)}")
+            logger.error("Error fetching exchange info: %s", e)
             raise
     
     def get_ticker_price(self, symbol: str) -> Dict[str, Any]:
-        """Get current ticker price for a symbol"""
+        """Get current ticker price for a symbol (cached for TICKER_PRICE_TTL seconds)"""
+        with self._ticker_lock:
+            cached = self._ticker_cache.get(symbol)
+        if cached is not None and time.monotonic() - cached[0] < TICKER_PRICE_TTL:
+            return cached[1]
+        
         try:
-            logger.info(f"Fetching ticker price for {symbol}")
-            ticker = self.client.futures_symbol_ticker(symbol=symbol)
-            logger.info(f"Current price for {symbol}: {ticker['price']}")
+            logger.info("Fetching ticker price for %s", symbol)
+            ticker = call_with_retry(self.client.futures_symbol_ticker, symbol=symbol)
+            logger.info("Current price for %s: %s", symbol, ticker['price'])
+            
+            with self._ticker_lock:
+                if len(self._ticker_cache) >= TICKER_CACHE_SIZE:
+                    self._ticker_cache.clear()
+                self._ticker_cache[symbol] = (time.monotonic(), ticker)
             return ticker
         except BinanceAPIException as e:
-            logger.error(f"Binance API error: {e.status_code} - {e.message}")
+            logger.error("Binance API error: %s - %s", e.status_code, e.message)
             raise
         except Exception as e:
-            logger.error(f"Error fetching ticker price: {str(e)}")
+            logger.error("Error fetching ticker price: %s", e)
             raise
     
     def get_balance(self) -> list:
         """Get futures account balance"""
         try:
             logger.info("Fetching account balance")
-            account = self.client.futures_account()
-            balances = [b for b in account['assets'] if float(b['walletBalance']) > 0]
-            logger.info(f"Found {len(balances)} assets with non-zero balance")
+            account = call_with_retry(self.client.futures_account)
+            # Most assets are exactly zero; a string compare avoids float() for them
+            balances = [
+                b for b in account['assets']
+                if b['walletBalance'] not in ('0', '0.00000000') and float(b['walletBalance']) > 0
+            ]
+            logger.info("Found %d assets with non-zero balance", len(balances))
             return balances
         except Exception as e:
-            logger.error(f"Error fetching balance: {str(e)}")
+            logger.error("Error fetching balance: %s", e)
             raise
     
     def get_open_orders(self, symbol: Optional[str] = None) -> list:
         """Get open orders"""
         try:
-            logger.info(f"Fetching open orders for {symbol or 'all symbols'}")
-            if symbol:
-                orders = self.client.futures_get_open_orders(symbol=symbol)
-            else:
-                orders = self.client.futures_get_open_orders()
-            logger.info(f"Found {len(orders)} open orders")
+            logger.info("Fetching open orders for %s", symbol or "all symbols")
+            params = {'symbol': symbol} if symbol else {}
+            orders = call_with_retry(self.client.futures_get_open_orders, **params)
+            logger.info("Found %d open orders", len(orders))
             return orders
         except Exception as e:
-            logger.error(f"Error fetching open orders: {str(e)}")
+            logger.error("Error fetching open orders: %s", e)
             raise
     
+    def snapshot(self, symbol: str) -> Tuple[list, list, Dict[str, Any]]:
+        """
+        Fetch balance, open orders and ticker price for a symbol
+        
+        The calls run one after another: python-binance's Client shares one
+        requests.Session and keeps the last response on the instance, so it
+        cannot serve concurrent requests safely.
+        
+        Returns:
+            (balances, open_orders, ticker)
+        """
+        return self.get_balance(), self.get_open_orders(symbol), self.get_ticker_price(symbol)
+    
     def test_connectivity(self) -> bool:
         """Test API connectivity"""
         try:
@@ -115,5 +234,15 @@ class BinanceFuturesClient:
             logger.info("Successfully connected to Binance Futures API")
             return True
         except Exception as e:
-            logger.error(f"Connectivity test failed: {str(e)}")
+            logger.error("Connectivity test failed: %s", e)
             return False
+
+@functools.lru_cache(maxsize=1)
+def get_client(api_key: str, api_secret: str, testnet: bool = True) -> BinanceFuturesClient:
+    """
+    Return the shared BinanceFuturesClient for these credentials
+    
+    The client (and its underlying HTTP session) is created once and reused,
+    so callers don't pay client setup and a new connection per request.
+    """
+    return BinanceFuturesClient(api_key, api_secret, testnet=testnet)
@@ -1,14 +1,151 @@
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
+import threading
+import time
+from collections.abc import Mapping
 from pathlib import Path
-from datetime import datetime
+from typing import Optional
+
+import orjson
 
 # Create logs directory
 LOGS_DIR = Path(__file__).parent.parent / "logs"
 LOGS_DIR.mkdir(exist_ok=True)
 
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders each distinct second's timestamp only once"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_time = (None, "")
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        if not datefmt:
+            return super().formatTime(record, datefmt)
+        sec = int(record.created)
+        cached_sec, cached_str = self._cached_time
+        if sec == cached_sec:
+            return cached_str
+        time_str = time.strftime(datefmt, self.converter(sec))
+        self._cached_time = (sec, time_str)
+        return time_str
+
+class JsonArgsFormatter(CachedTimeFormatter):
+    """Formatter that renders dict/list log arguments as compact JSON
+    
+    Lets callers pass payloads lazily, e.g. logger.info("Order: %s", order),
+    so serialization only happens when a handler actually emits the record.
+    """
+    
+    def format(self, record: logging.LogRecord) -> str:
+        self.render_args(record)
+        return super().format(record)
+    
+    @classmethod
+    def render_args(cls, record: logging.LogRecord) -> None:
+        """Replace dict/list arguments on the record with their JSON text (idempotent)"""
+        args = record.args
+        if isinstance(args, Mapping) and "%(" not in str(record.msg):
+            # logging unwraps a single mapping argument into record.args
+            record.args = (cls._to_json(args),)
+        elif isinstance(args, tuple):
+            record.args = tuple(
+                cls._to_json(a) if isinstance(a, (Mapping, list)) else a for a in args
+            )
+    
+    @staticmethod
+    def _to_json(value) -> str:
+        return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves message formatting to the listener thread
+    
+    Dict/list arguments are serialized at enqueue time, so a caller that
+    mutates a logged payload afterwards (or a shared cached dict) cannot
+    change what gets written. Message interpolation, timestamps and I/O
+    still happen on the listener thread.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Only reached for records the logger has enabled
+        JsonArgsFormatter.render_args(record)
+        return record
+
+class BufferedRotatingFileHandler(logging.handlers.TimedRotatingFileHandler):
+    """TimedRotatingFileHandler that batches writes instead of flushing every record
+    
+    Records collect in a large file buffer that is written out when full,
+    flush_interval seconds after the first unflushed record, or on close
+    and rollover. A single daemon thread does the deferred flushes.
+    """
+    
+    def __init__(self, filename, *args, buffer_size: int = 65536,
+                 flush_interval: float = 0.2, **kwargs):
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._force_flush = False
+        self._flush_pending = threading.Event()
+        self._flusher_stop = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        super().__init__(filename, *args, **kwargs)
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=self.errors)
+    
+    def flush(self) -> None:
+        """Request a deferred flush; only the flusher thread and close() write immediately"""
+        self.acquire()
+        try:
+            if self._force_flush:
+                super().flush()
+                return
+            # Called by emit() after every record: batch the write instead
+            self._flush_pending.set()
+            if self._flusher is None and not self._flusher_stop.is_set():
+                self._flusher = threading.Thread(
+                    target=self._flush_loop, name="log-flusher", daemon=True
+                )
+                self._flusher.start()
+        finally:
+            self.release()
+    
+    def _flush_loop(self) -> None:
+        while True:
+            self._flush_pending.wait()
+            # Let records accumulate for flush_interval; stop early on close()
+            if self._flusher_stop.wait(self.flush_interval):
+                return
+            self.acquire()
+            try:
+                # Cleared under the lock so later records request a new flush
+                self._flush_pending.clear()
+                self._force_flush = True
+                self.flush()
+            finally:
+                self._force_flush = False
+                self.release()
+    
+    def close(self) -> None:
+        self._flusher_stop.set()
+        self._flush_pending.set()
+        self.acquire()
+        try:
+            # Drain the buffer; the flusher thread exits on its own
+            self._force_flush = True
+            super().close()
+        finally:
+            self.release()
+
 def setup_logger(name: str = "trading_bot") -> logging.Logger:
-    """Setup and configure logger with file and console handlers"""
+    """Setup and configure logger with file and console handlers
+    
+    The handlers run on a QueueListener thread; the logger itself only
+    enqueues records, keeping disk writes off the caller's path.
+    """
     logger = logging.getLogger(name)
     logger.setLevel(logging.INFO)
     
@@ -16,9 +153,11 @@ def setup_logger(name: str = "trading_bot") -> logging.Logger:
     if logger.handlers:
         return logger
     
-    # File handler - append to daily log file
-    log_file = LOGS_DIR / f"trading_bot_{datetime.now().strftime('%Y%m%d')}.log"
-    file_handler = logging.FileHandler(log_file, mode='a')
+    # File handler - rotated at midnight, keeping a week of history
+    log_file = LOGS_DIR / "trading_bot.log"
+    file_handler = BufferedRotatingFileHandler(
+        log_file, when='midnight', backupCount=7, delay=True, encoding='utf-8'
+    )
     file_handler.setLevel(logging.INFO)
     
     # Console handler
@@ -26,15 +165,22 @@ def setup_logger(name: str = "trading_bot") -> logging.Logger:
     console_handler.setLevel(logging.ERROR)
     
     # Format
-    formatter = logging.Formatter(
+    formatter = JsonArgsFormatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     file_handler.setFormatter(formatter)
     console_handler.setFormatter(formatter)
     
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # Emit from a background thread; drain the queue on interpreter exit
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+    
+    logger.addHandler(DeferredQueueHandler(log_queue))
     
     return logger
 
@@ -1,9 +1,17 @@
 from binance.exceptions import BinanceAPIException, BinanceRequestException
-from typing import Dict, Any, Optional
-from .client import BinanceFuturesClient
+from typing import Dict, Any, Optional, List
+from .client import BinanceFuturesClient, call_with_retry
 from .validators import OrderRequest
 from .logging_config import logger
-import json
+from decimal import Decimal
+import orjson
+
+# Maximum number of orders Binance Futures accepts per batchOrders request
+BATCH_ORDER_LIMIT = 5
+
+def _format_decimal(value: float) -> str:
+    """Format a number as a plain decimal string; Binance rejects e.g. '1e-05'"""
+    return format(Decimal(repr(value)), 'f')
 
 class OrderManager:
     """Handles order placement and management"""
@@ -24,7 +32,7 @@ class OrderManager:
             )
             
             logger.info(f"MARKET order placed successfully: OrderID={order['orderId']}, Status={order['status']}")
-            logger.info(f"Order response: {json.dumps(order, indent=2)}")
+            logger.info("Order response: %s", order)
             
             return order
         except BinanceAPIException as e:
@@ -52,7 +60,7 @@ class OrderManager:
             )
             
             logger.info(f"LIMIT order placed successfully: OrderID={order['orderId']}, Status={order['status']}")
-            logger.info(f"Order response: {json.dumps(order, indent=2)}")
+            logger.info("Order response: %s", order)
             
             return order
         except BinanceAPIException as e:
@@ -69,9 +77,6 @@ class OrderManager:
     
     def place_order(self, order_request: OrderRequest) -> Dict[str, Any]:
         """Place an order based on OrderRequest"""
-        # Validate price fields
-        order_request.validate_price_fields()
-        
         order_type = order_request.order_type
         
         if order_type == "MARKET":
@@ -90,6 +95,66 @@ class OrderManager:
         else:
             raise ValueError(f"Unsupported order type: {order_type}")
     
+    def place_orders_batch(self, order_requests: List[OrderRequest]) -> List[Dict[str, Any]]:
+        """
+        Place several orders via the batchOrders endpoint, up to 5 per request
+        
+        Returns one entry per order request, in input order. Orders rejected by
+        Binance are returned as {'code': ..., 'msg': ...} instead of raising.
+        If a batch request fails, its orders and every batch not yet sent are
+        returned as error entries too, so orders already placed by earlier
+        batches are never lost to the caller.
+        """
+        batch_orders = []
+        for order_request in order_requests:
+            params = {
+                'symbol': order_request.symbol,
+                'side': order_request.side,
+                'type': order_request.order_type,
+                'quantity': _format_decimal(order_request.quantity)
+            }
+            if order_request.order_type == "LIMIT":
+                params['timeInForce'] = 'GTC'
+                params['price'] = _format_decimal(order_request.price)
+            batch_orders.append(params)
+        
+        results = []
+        for start in range(0, len(batch_orders), BATCH_ORDER_LIMIT):
+            chunk = batch_orders[start:start + BATCH_ORDER_LIMIT]
+            try:
+                logger.info(f"Placing batch of {len(chunk)} orders")
+                
+                response = self.client.client.futures_place_batch_order(
+                    batchOrders=orjson.dumps(chunk).decode()
+                )
+                
+                rejected = sum(1 for order in response if 'orderId' not in order)
+                logger.info(f"Batch placed: {len(chunk) - rejected} accepted, {rejected} rejected")
+                
+                results.extend(response)
+                continue
+            except BinanceAPIException as e:
+                logger.error(f"Binance API error placing batch orders: {e.status_code} - {e.message}")
+                error = {'code': e.code, 'msg': f"API Error: {e.message}"}
+            except BinanceRequestException as e:
+                logger.error(f"Binance request error: {str(e)}")
+                error = {'code': None, 'msg': f"Request Error: {str(e)}"}
+            except Exception as e:
+                logger.error(f"Unexpected error placing batch orders: {str(e)}")
+                error = {'code': None, 'msg': f"Error: {str(e)}"}
+            
+            # Stop sending; report the failed batch and everything after it
+            results.extend(dict(error) for _ in chunk)
+            unsent = len(batch_orders) - start - len(chunk)
+            if unsent:
+                logger.error(f"Skipping {unsent} unsent orders after failed batch")
+                results.extend(
+                    {'code': None, 'msg': "Not sent: an earlier batch failed"} for _ in range(unsent)
+                )
+            break
+        
+        return results
+    
     def cancel_order(self, symbol: str, order_id: int) -> Dict[str, Any]:
         """Cancel an open order"""
         try:
@@ -108,7 +173,8 @@ class OrderManager:
         """Get order status"""
         try:
             logger.info(f"Fetching status for order {order_id}")
-            order = self.client.client.futures_get_order(
+            order = call_with_retry(
+                self.client.client.futures_get_order,
                 symbol=symbol,
                 orderId=order_id
             )
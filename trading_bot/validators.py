@@ -1,47 +1,73 @@
-from typing import Optional, Literal
-from pydantic import BaseModel, Field, validator
+from typing import Optional, Literal, Mapping, Any, Union, Annotated, get_args
+import msgspec
 import re
 
 OrderSide = Literal["BUY", "SELL"]
 OrderType = Literal["MARKET", "LIMIT"]
 
-class OrderRequest(BaseModel):
-    """Validates order request parameters"""
-    symbol: str = Field(..., description="Trading pair symbol, e.g., BTCUSDT")
-    side: OrderSide = Field(..., description="Order side: BUY or SELL")
-    order_type: OrderType = Field(..., alias="orderType", description="Order type: MARKET or LIMIT")
-    quantity: float = Field(..., gt=0, description="Order quantity, must be positive")
-    price: Optional[float] = Field(None, gt=0, description="Price for LIMIT orders")
-    
-    class Config:
-        populate_by_name = True
-    
-    @validator('symbol')
-    def validate_symbol(cls, v):
-        """Validate symbol format"""
-        if not re.match(r'^[A-Z0-9]+$', v):
-            raise ValueError('Symbol must contain only uppercase letters and numbers')
-        return v
-    
-    @validator('side')
-    def validate_side(cls, v):
-        """Validate order side"""
-        if v not in ["BUY", "SELL"]:
+PositiveFloat = Annotated[float, msgspec.Meta(gt=0)]
+
+_SYMBOL_RE = re.compile(r'[A-Z0-9]+').fullmatch
+_ORDER_SIDES = frozenset(get_args(OrderSide))
+_ORDER_TYPES = frozenset(get_args(OrderType))
+
+class OrderRequest(msgspec.Struct, frozen=True):
+    """Validates order request parameters
+
+    msgspec only type-checks when decoding, so __post_init__ repeats the
+    field rules to cover direct construction as well.
+    """
+    symbol: str  # Trading pair symbol, e.g., BTCUSDT
+    side: OrderSide  # Order side: BUY or SELL
+    order_type: OrderType = msgspec.field(name="orderType")  # Order type: MARKET or LIMIT
+    quantity: PositiveFloat  # Order quantity, must be positive
+    price: Optional[PositiveFloat] = None  # Price for LIMIT orders
+
+    def __post_init__(self):
+        """Validate field values and price fields based on order type"""
+        symbol = self.symbol
+        if not isinstance(symbol, str) or not _SYMBOL_RE(symbol):
+            # Tolerate surrounding whitespace; only pay for strip() when needed
+            stripped = symbol.strip() if isinstance(symbol, str) else symbol
+            if stripped is symbol or not _SYMBOL_RE(stripped):
+                raise ValueError('Symbol must contain only uppercase letters and numbers')
+            msgspec.structs.force_setattr(self, 'symbol', stripped)
+
+        if self.side not in _ORDER_SIDES:
             raise ValueError('Side must be either BUY or SELL')
-        return v
-    
-    @validator('order_type')
-    def validate_order_type(cls, v):
-        """Validate order type"""
-        valid_types = ["MARKET", "LIMIT"]
-        if v not in valid_types:
-            raise ValueError(f'Order type must be one of {valid_types}')
-        return v
-    
-    def validate_price_fields(self):
-        """Validate price fields based on order type"""
-        if self.order_type == "LIMIT":
-            if self.price is None:
+
+        if self.order_type not in _ORDER_TYPES:
+            raise ValueError('Order type must be one of MARKET, LIMIT')
+
+        quantity = self.quantity
+        if type(quantity) not in (float, int) or quantity <= 0:
+            raise ValueError('Quantity must be a positive number')
+
+        price = self.price
+        if price is None:
+            if self.order_type == "LIMIT":
                 raise ValueError("Price is required for LIMIT orders")
-        
-        return True
+        elif type(price) not in (float, int) or price <= 0:
+            raise ValueError('Price must be a positive number')
+
+_order_request_decoder = msgspec.json.Decoder(OrderRequest)
+
+def parse_order_request(data: Union[Mapping[str, Any], bytes, str]) -> OrderRequest:
+    """
+    Validate raw order fields into an OrderRequest
+
+    Leading/trailing whitespace around the symbol is stripped.
+
+    Args:
+        data: Mapping or JSON document keyed by API field names (e.g. orderType)
+
+    Raises:
+        ValueError: If any field is missing or invalid
+    """
+    try:
+        if isinstance(data, (bytes, str)):
+            return _order_request_decoder.decode(data)
+        return msgspec.convert(data, OrderRequest)
+    except msgspec.DecodeError as e:
+        # Covers msgspec.ValidationError as well as malformed JSON
+        raise ValueError(str(e)) from e